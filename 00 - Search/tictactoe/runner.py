@@ -66,7 +66,8 @@ while True:
 
     else:
 
-        # Draw game board
+        # Draw game board (translate the bitboard state to a grid once)
+        grid = ttt.to_grid(board)
         tile_size = 80
         tile_origin = (width / 2 - (1.5 * tile_size),
                        height / 2 - (1.5 * tile_size))
@@ -81,8 +82,8 @@ while True:
                 )
                 pygame.draw.rect(screen, white, rect, 3)
 
-                if board[i][j] != ttt.EMPTY:
-                    move = moveFont.render(board[i][j], True, white)
+                if grid[i][j] != ttt.EMPTY:
+                    move = moveFont.render(grid[i][j], True, white)
                     moveRect = move.get_rect()
                     moveRect.center = rect.center
                     screen.blit(move, moveRect)
@@ -124,8 +125,8 @@ while True:
             mouse = pygame.mouse.get_pos()
             for i in range(3):
                 for j in range(3):
-                    if (board[i][j] == ttt.EMPTY and tiles[i][j].collidepoint(mouse)):
-                        board = ttt.result(board, (i, j))
+                    if (grid[i][j] == ttt.EMPTY and tiles[i][j].collidepoint(mouse)):
+                        board = ttt.result(board, 3 * i + j)
 
         if game_over:
             againButton = pygame.Rect(width / 3, height - 65, width / 3, 50)
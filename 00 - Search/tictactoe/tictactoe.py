@@ -3,106 +3,143 @@ Tic Tac Toe Player
 """
 
 import math
-from copy import deepcopy
+from functools import lru_cache
 
 X = "X"
 O = "O"
 EMPTY = None
 
+### the game state is a (x_bits, o_bits) pair of 9-bit ints where bit
+### (3*i + j) is set if that side occupies cell (i, j). The pair is
+### immutable and hashable, comparisons are single int ops, and making a
+### move allocates nothing beyond the 2-tuple. The UI translates to a
+### 3x3 grid only for rendering via to_grid().
+FULL_BOARD = 0b111111111
+WIN_MASKS = (
+    0b000000111, 0b000111000, 0b111000000,   # rows
+    0b001001001, 0b010010010, 0b100100100,   # columns
+    0b100010001, 0b001010100,                # diagonals
+)
+
+### fixed exploration order (bit indices): centre first, then corners,
+### then edges. Trying the strongest squares first makes alpha/beta
+### cutoffs fire sooner.
+BIT_ORDER = (4, 0, 2, 6, 8, 1, 3, 5, 7)
+
+### transposition table: positions reached by different move orders are
+### evaluated once and reused. Keyed on the (x_bits, o_bits) state pair,
+### storing (value, flag) where the flag records whether the value is exact
+### or only a bound (because alpha/beta cut the search short).
+EXACT = 0
+LOWERBOUND = 1
+UPPERBOUND = 2
+transposition_table = {}
+
 
 def initial_state():
     """
     Returns starting state of the board.
     """
-    return [[EMPTY, EMPTY, EMPTY],
-            [EMPTY, EMPTY, EMPTY],
-            [EMPTY, EMPTY, EMPTY]]
+    return (0, 0)
+
+
+def to_grid(board):
+    """
+    Returns the 3x3 list-of-lists view of a state, for rendering.
+    """
+    x_bits, o_bits = board
+    grid = []
+    for i in range(3):
+        row = []
+        for j in range(3):
+            bit = 3*i + j
+            if (x_bits >> bit) & 1:
+                row.append(X)
+            elif (o_bits >> bit) & 1:
+                row.append(O)
+            else:
+                row.append(EMPTY)
+        grid.append(row)
+    return grid
+
+
+def bits_winner(x_bits, o_bits):
+    """
+    Returns the winner on a bitboard, if there is one.
+    """
+    for mask in WIN_MASKS:
+        if (x_bits & mask) == mask:
+            return X
+        if (o_bits & mask) == mask:
+            return O
+    return None
+
+
+def analyze(x_bits, o_bits):
+    """
+    Fused single pass over a bitboard: returns (who_won, empties) where
+    empties is a tuple of the free bit indices in search order. The game
+    is over when who_won is not None or empties is exhausted. Saves the
+    search from running separate winner/terminal/actions scans per node.
+    """
+    for mask in WIN_MASKS:
+        if (x_bits & mask) == mask:
+            return X, ()
+        if (o_bits & mask) == mask:
+            return O, ()
+    occupied = x_bits | o_bits
+    return None, tuple(bit for bit in BIT_ORDER if not (occupied >> bit) & 1)
 
 
 def player(board):
     """
     Returns player who has the next turn on a board.
     """
-
-    ### Counts the amount of turns each player has taken.
-    X_count = 0
-    O_count = 0
-    for i in board:
-        for j in i:
-            if j == "X":
-                X_count += 1
-            elif j == "O":
-                O_count += 1
+    x_bits, o_bits = board
 
     if terminal(board):
         return None
-    elif X_count == O_count:
-        return "X"
+    elif bin(x_bits).count("1") == bin(o_bits).count("1"):
+        return X
     else:
-        return "O"
+        return O
 
 
 def actions(board):
     """
-    Returns set of all possible actions (i, j) available on the board.
+    Returns set of all possible actions (bit indices) available on the board.
     """
-    possible_moves = set()
-    for i in range(3):
-        for j in range(3):
-            if board[i][j] == EMPTY:
-                possible_moves.add((i,j))
-
-    return possible_moves
+    x_bits, o_bits = board
+    occupied = x_bits | o_bits
+    return {bit for bit in range(9) if not (occupied >> bit) & 1}
 
 
 def result(board, action):
     """
-    Returns the board that results from making move (i, j) on the board.
+    Returns the state that results from playing bit index `action`.
     """
-    updated_board = deepcopy(board)
-    try:
-        if action not in actions(board):
-            raise ValueError
-        else:
-            updated_board[action[0]][action[1]] = player(board)
-
-    except ValueError:
-        print("Invalid action. Only EMPTY spaces are valid places to make a move")
-
-    return updated_board
+    ### Validity of the action is checked at the UI boundary (runner.py only
+    ### allows clicks on EMPTY tiles), so no per-call validation here.
+    x_bits, o_bits = board
+    if bin(x_bits).count("1") == bin(o_bits).count("1"):
+        return (x_bits | (1 << action), o_bits)
+    else:
+        return (x_bits, o_bits | (1 << action))
 
 
 def winner(board):
     """
     Returns the winner of the game, if there is one.
     """
-
-    ### check for horizontal wins
-    for row in board:
-        if all(col == row[0] for col in row): return row[0]
-    ### check for vertical and diagonal wins
-    if board[0][0] == board[1][0] == board[2][0]: return board[0][0]
-    elif board[0][1] == board[1][1] == board[2][1]: return board[0][1]
-    elif board[0][2] == board[1][2] == board[2][2]: return board[0][2]
-    elif board[0][0] == board[1][1] == board[2][2]: return board[0][0]
-    elif board[0][2] == board[1][1] == board[2][0]: return board[0][2]
-    else: return None
+    return bits_winner(board[0], board[1])
 
 
 def terminal(board):
     """
     Returns True if game is over, False otherwise.
     """
-    ### check to see if there is a winner
-    if winner(board) != None:   return True
-
-    ### check to see if board is full
-    for i in board:
-        for j in i:
-            if j == EMPTY:
-                return False
-
-    return True
+    x_bits, o_bits = board
+    return (x_bits | o_bits) == FULL_BOARD or bits_winner(x_bits, o_bits) is not None
 
 
 def utility(board):
@@ -110,51 +147,128 @@ def utility(board):
     Returns 1 if X has won the game, -1 if O has won, 0 otherwise.
     """
     who_won = winner(board)
-    if who_won == "X": return 1
-    elif who_won == "O": return -1
+    if who_won == X: return 1
+    elif who_won == O: return -1
     else: return 0
 
 
+def lookup(state, alpha, beta):
+    """
+    Checks the transposition table for a usable stored value. Returns the
+    value if the entry settles this search window, otherwise None along
+    with possibly tightened (alpha, beta) bounds.
+    """
+    entry = transposition_table.get(state)
+    if entry is not None:
+        value, flag = entry
+        if flag == EXACT:
+            return value, alpha, beta
+        elif flag == LOWERBOUND:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return value, alpha, beta
+    return None, alpha, beta
+
+
+def store(state, v, alpha, beta):
+    """
+    Records v in the transposition table, flagged by how it relates to the
+    search window it was computed in.
+    """
+    if v <= alpha:
+        transposition_table[state] = (v, UPPERBOUND)
+    elif v >= beta:
+        transposition_table[state] = (v, LOWERBOUND)
+    else:
+        transposition_table[state] = (v, EXACT)
+
+
+@lru_cache(maxsize=None)
 def minimax(board):
     """
-    Returns the optimal action for the current player on the board.
+    Returns the optimal action (bit index) for the current player on the board.
+
+    The state is a hashable int pair, so the chosen move per position is
+    memoized: asking about a previously seen position (there are only a
+    few thousand reachable ones) is a dict hit, no search at all. The
+    value functions below are already memoized by the transposition
+    table, which caches across alpha/beta windows via bound flags.
     """
-    if board == initial_state():
-        return (0,0)
+    if board == (0, 0):
+        return 0
+
+    ### one fused scan instead of separate player/terminal/actions calls
+    x_bits, o_bits = board
+    who_won, empties = analyze(x_bits, o_bits)
+    if who_won is not None or not empties:
+        return None
 
-    if player(board) == "X":
+    if bin(x_bits).count("1") == bin(o_bits).count("1"):
         v = -math.inf
         move = None
-        for action in actions(board):
-            min_val = min_value(result(board, action))
+        for bit in empties:
+            min_val = min_value(x_bits | (1 << bit), o_bits, v, math.inf)
             if min_val > v:
                 v = min_val
-                move = action
+                move = bit
     else:
         v = math.inf
         move = None
-        for action in actions(board):
-            max_val = max_value(result(board, action))
+        for bit in empties:
+            max_val = max_value(x_bits, o_bits | (1 << bit), -math.inf, v)
             if max_val < v:
                 v = max_val
-                move = action
+                move = bit
 
     return move
 
 
-def max_value(board):
-    if terminal(board):
-        return utility(board)
+def max_value(x_bits, o_bits, alpha, beta):
+    who_won, empties = analyze(x_bits, o_bits)
+    if who_won == X: return 1
+    elif who_won == O: return -1
+    elif not empties: return 0
+
+    state = (x_bits, o_bits)
+    cached, alpha, beta = lookup(state, alpha, beta)
+    if cached is not None:
+        return cached
+
+    original_alpha = alpha
     v = -math.inf
-    for action in actions(board):
-        v = max(v,min_value(result(board,action)))
+    for bit in empties:
+        ### making a move is a pure int OR - no board allocation at all
+        v = max(v, min_value(x_bits | (1 << bit), o_bits, alpha, beta))
+        ### prune: the minimising player upstream already has a move
+        ### at least as good as beta, so this subtree cannot matter.
+        if v >= beta:
+            break
+        alpha = max(alpha, v)
+
+    store(state, v, original_alpha, beta)
     return v
 
 
-def min_value(board):
-    if terminal(board):
-        return utility(board)
+def min_value(x_bits, o_bits, alpha, beta):
+    who_won, empties = analyze(x_bits, o_bits)
+    if who_won == X: return 1
+    elif who_won == O: return -1
+    elif not empties: return 0
+
+    state = (x_bits, o_bits)
+    cached, alpha, beta = lookup(state, alpha, beta)
+    if cached is not None:
+        return cached
+
+    original_beta = beta
     v = math.inf
-    for action in actions(board):
-        v = min(v,max_value(result(board,action)))
+    for bit in empties:
+        v = min(v, max_value(x_bits, o_bits | (1 << bit), alpha, beta))
+        if v <= alpha:
+            break
+        beta = min(beta, v)
+
+    store(state, v, alpha, original_beta)
     return v
@@ -12,23 +12,32 @@ class Minesweeper():
         # Set initial width, height, and number of mines
         self.height = height
         self.width = width
-        self.mines = set()
 
-        # Initialize an empty field with no mines
-        self.board = []
+        # Flat board: one byte per cell, indexed i*width + j. Contiguous
+        # memory and a single index calculation per lookup.
+        self.board = bytearray(height * width)
+
+        # Add mines with one collision-free draw; the old rejection loop
+        # re-sampled on every clash, degrading as mine density grows.
+        mine_indices = random.sample(range(height * width), mines)
+        self.mines = {(index // width, index % width) for index in mine_indices}
+        for index in mine_indices:
+            self.board[index] = 1
+
+        # The mine layout never changes after init, so precompute the
+        # nearby-mine count of every cell once; nearby_mines becomes an
+        # O(1) lookup instead of a 3x3 window scan per call.
+        self.nearby = []
         for i in range(self.height):
             row = []
             for j in range(self.width):
-                row.append(False)
-            self.board.append(row)
-
-        # Add mines randomly
-        while len(self.mines) != mines:
-            i = random.randrange(height)
-            j = random.randrange(width)
-            if not self.board[i][j]:
-                self.mines.add((i, j))
-                self.board[i][j] = True
+                nearby_count = 0
+                for x in range(max(0, i - 1), min(i + 2, self.height)):
+                    for y in range(max(0, j - 1), min(j + 2, self.width)):
+                        if (x, y) != (i, j) and self.board[x * self.width + y]:
+                            nearby_count += 1
+                row.append(nearby_count)
+            self.nearby.append(row)
 
         # At first, player has found no mines
         self.mines_found = set()
@@ -41,7 +50,7 @@ class Minesweeper():
         for i in range(self.height):
             print("--" * self.width + "-")
             for j in range(self.width):
-                if self.board[i][j]:
+                if self.board[i * self.width + j]:
                     print("|X", end="")
                 else:
                     print("| ", end="")
@@ -50,7 +59,7 @@ class Minesweeper():
 
     def is_mine(self, cell):
         i, j = cell
-        return self.board[i][j]
+        return bool(self.board[i * self.width + j])
 
     def nearby_mines(self, cell):
         """
@@ -58,24 +67,7 @@ class Minesweeper():
         within one row and column of a given cell,
         not including the cell itself.
         """
-
-        # Keep count of nearby mines
-        count = 0
-
-        # Loop over all cells within one row and column
-        for i in range(cell[0] - 1, cell[0] + 2):
-            for j in range(cell[1] - 1, cell[1] + 2):
-
-                # Ignore the cell itself
-                if (i, j) == cell:
-                    continue
-
-                # Update count if cell in bounds and is mine
-                if 0 <= i < self.height and 0 <= j < self.width:
-                    if self.board[i][j]:
-                        count += 1
-
-        return count
+        return self.nearby[cell[0]][cell[1]]
 
     def won(self):
         """
@@ -84,80 +76,16 @@ class Minesweeper():
         return self.mines_found == self.mines
 
 
-class Sentence():
-    """
-    Logical statement about a Minesweeper game
-    A sentence consists of a set of board cells,
-    and a count of the number of those cells which are mines.
-    """
-
-    def __init__(self, cells, count):
-        self.cells = set(cells)
-        self.count = count
-
-    def __eq__(self, other):
-        return self.cells == other.cells and self.count == other.count
-
-    def __str__(self):
-        return f"{self.cells} = {self.count}"
-
-    def known_mines(self):
-        """
-        Returns the set of all cells in self.cells known to be mines.
-        """
-        ### Any time the number of cells is equal to the count, we know that all of that sentence’s cells must be mines.
-        if len(self.cells) == self.count:
-            return self.cells
-        else:
-            return set()
-
-    def known_safes(self):
-        """
-        Returns the set of all cells in self.cells known to be safe.
-        """
-        ### Any time the count is equal to 0, we know that all of that sentence’s cells must be safe.
-        if self.count == 0:
-            return self.cells
-        else:
-            return set()
-
-    def mark_mine(self, cell):
-        """
-        Updates internal knowledge representation given the fact that
-        a cell is known to be a mine.
-        """
-        if cell in self.cells:
-            self.cells.remove(cell)
-            self.count -= 1
-
-    def mark_safe(self, cell):
-        """
-        Updates internal knowledge representation given the fact that
-        a cell is known to be safe.
-        """
-        if cell in self.cells:
-            self.cells.remove(cell)
-
-    def is_subset(self, other_sentence):
-        ## tests to see if it is a subset of other sentence.
-        ## returns true if yes it is or false if no it is not.
-        if self.cells != other_sentence.cells and self.cells.issubset(other_sentence.cells):
-            return True
-        else:
-            return False
-
-    def infer_new_sentance(self, other_sentence):
-        ### where self.cells is a subset of other_sentence.cells a new sentence is made
-        different_cells = other_sentence.cells.difference(self.cells)
-        different_count = other_sentence.count - self.count
-        new_sentence = Sentence(different_cells, different_count)
-
-        return new_sentence
-
-
 class MinesweeperAI():
     """
     Minesweeper game player
+
+    Knowledge is a dict mapping a cell bitmask (bit i*width + j is set
+    if cell (i, j) is in the sentence) to the number of mines among
+    those cells. Keying sentences on their mask means a duplicate
+    inferred by different routes merges into one entry on insert
+    instead of bloating every later quadratic inference scan, and the
+    subset/difference operations stay single integer bit ops.
     """
 
     def __init__(self, height=8, width=8):
@@ -173,8 +101,44 @@ class MinesweeperAI():
         self.mines = set()
         self.safes = set()
 
-        # List of sentences about the game known to be true
-        self.knowledge = []
+        # Bitmask mirrors of the mines/safes sets, kept in sync by
+        # mark_mine/mark_safe so sentences can be filtered with bit ops
+        self.mines_mask = 0
+        self.safes_mask = 0
+
+        # Per-cell neighbour bitmasks; fixed by board geometry, so built
+        # once instead of re-deriving the 3x3 window on every click
+        self.neighbor_masks = []
+        for i in range(height):
+            row = []
+            for j in range(width):
+                mask = 0
+                for x in range(max(0, i - 1), min(i + 2, height)):
+                    for y in range(max(0, j - 1), min(j + 2, width)):
+                        if (x, y) != (i, j):
+                            mask |= 1 << (x * width + y)
+                row.append(mask)
+            self.neighbor_masks.append(row)
+
+        # Sentences about the game known to be true: cell bitmask -> count
+        self.knowledge = {}
+
+    def cell_index(self, cell):
+        """
+        Maps a (i, j) cell to its bit index in sentence bitmasks.
+        """
+        return cell[0] * self.width + cell[1]
+
+    def cells_in_mask(self, mask):
+        """
+        Yields the (i, j) cells whose bits are set in a sentence bitmask.
+        """
+        index = 0
+        while mask:
+            if mask & 1:
+                yield divmod(index, self.width)
+            mask >>= 1
+            index += 1
 
     def mark_mine(self, cell):
         """
@@ -182,8 +146,17 @@ class MinesweeperAI():
         to mark that cell as a mine as well.
         """
         self.mines.add(cell)
-        for sentence in self.knowledge:
-            sentence.mark_mine(cell)
+        bit = 1 << self.cell_index(cell)
+        self.mines_mask |= bit
+        updated = {}
+        for cells, count in self.knowledge.items():
+            if cells & bit:
+                # clearing the bit may collapse onto an existing entry,
+                # deduplicating the two sentences in passing
+                updated[cells ^ bit] = count - 1
+            else:
+                updated[cells] = count
+        self.knowledge = updated
 
     def mark_safe(self, cell):
         """
@@ -191,8 +164,15 @@ class MinesweeperAI():
         to mark that cell as safe as well.
         """
         self.safes.add(cell)
-        for sentence in self.knowledge:
-            sentence.mark_safe(cell)
+        bit = 1 << self.cell_index(cell)
+        self.safes_mask |= bit
+        updated = {}
+        for cells, count in self.knowledge.items():
+            if cells & bit:
+                updated[cells ^ bit] = count
+            else:
+                updated[cells] = count
+        self.knowledge = updated
 
     def add_knowledge(self, cell, count):
         """
@@ -209,99 +189,66 @@ class MinesweeperAI():
             5) add any new sentences to the AI's knowledge base
                if they can be inferred from existing knowledge
         """
-        ## form new sentance and add to knowledge base
-        neibouring_cells = set()
-        for i in range(max(0, cell[0]-1), min(cell[0] + 2, self.height)):
-            for j in range(max(0, cell[1]-1), min(cell[1] + 2, self.width)):
-                # Add the cell clicked on to moves made and safe set sets
-                if (i, j) == cell:
-                    self.moves_made.add(cell)
-                    self.mark_safe(cell)
-                else:
-                    neibouring_cells.add((i,j))
+        ## mark the clicked cell as a move made and safe
+        self.moves_made.add(cell)
+        self.mark_safe(cell)
 
-        new_sentence = Sentence(neibouring_cells, count)
-        ## marks mines and safes for new sentance.
-        for mine in self.mines:
-            new_sentence.mark_mine(mine)
-        for safe in self.safes:
-            new_sentence.mark_safe(safe)
+        ## form new sentance straight from the precomputed neighbour mask,
+        ## dropping known mines and safes with pure bit ops.
+        neighbors = self.neighbor_masks[cell[0]][cell[1]]
+        neibouring_cells = neighbors & ~self.mines_mask & ~self.safes_mask
+        count -= bin(neighbors & self.mines_mask).count("1")
 
-        ## add new sentence to knowledge base.
-        self.knowledge.append(new_sentence)
+        ## add new sentence to knowledge base (an O(1) merge if an equal
+        ## sentence was already inferred by another route).
+        if neibouring_cells:
+            self.knowledge[neibouring_cells] = count
 
         """
-        update knowledge base in any inferneces can be made.
-        while any one of the three inference moves can generate new knowledge or ascribe a
-        cell as a mine or safe this loop will continue (i.e. until no more inferences can be
-        made and all new knowledge genereated by the new sentence/cell has been accounted for.)
+        update knowledge base while any inferences can be made. A single
+        changed flag tracks whether the pass produced new knowledge or marked
+        a cell; the old scheme re-ran three full O(n^2) probe scans per loop
+        test just to decide whether to loop again, discarding their results.
         """
-        while self.inference_1() or self.inference_2() or self.inference_3():
+        changed = True
+        while changed:
+            changed = False
 
             # find any subsetting possibilities and update knowledge base.
-            for sentence_1 in self.knowledge.copy():
-                for sentence_2 in self.knowledge.copy():
-                    if sentence_1.is_subset(sentence_2):
-                        new_sentence = sentence_1.infer_new_sentance(sentence_2)
-                        self.knowledge.append(new_sentence)
-                        self.knowledge.remove(sentence_2)
-
-            # find any known mines or safes sentences and update mines and safes set
-            for sentence in self.knowledge:
-                for cell in sentence.known_safes().copy():
-                    self.mark_safe(cell)
-                for cell in sentence.known_mines().copy():
-                    self.mark_mine(cell)
-
-            # remove all empty sets in knowledge
-            for sentence in self.knowledge:
-                if sentence.cells == set():
-                    self.knowledge.remove(sentence)
-
-    """
-    These three infernce functions loop over all sentences in knowledge and retrun
-    a list of sentences that result from the relevant inferneces rules. If any of the
-    three lists is not empty a infernece can be made and the subsequent knowledge can be added to knowledge bank.
-    They are used in for the while loops condition to check if any inferneces can be made.
-    I.e. While inferneces can be made they will be made and knowledge will be updated.
-    """
-
-    def inference_1(self):
-        """
-        Returns a list of new sentences, that can be formed by sub set infernece rule.
-        That is to say if a sentence.cells is a subset of another sentance.cells, then the
-        differnce will be found and the count will be calculated and a new sentance will
-        be added to a list that will be returned.
-
-        knowledge must be a list of Sentences()
-        """
-        new_sentences = []
-        for sentence_1 in self.knowledge:
-            for sentence_2 in self.knowledge:
-                if sentence_1.is_subset(sentence_2):
-                    new_sentence = sentence_1.infer_new_sentance(sentence_2)
-                    new_sentences.append(new_sentence)
-        return new_sentences
-
-    def inference_2(self):
-        """
-        Returns a list of sentances where there are known safes. I.e where sentance.count = 0 and all cells are therefore safe.
-        """
-        safe_sentences = []
-        for sentence in self.knowledge:
-            if sentence.known_safes() != set():
-                safe_sentences.append(sentence)
-        return safe_sentences
-
-    def inference_3(self):
-        """
-        Returns a list of sentences where there are known mines. I.e. where  length of set is equal to count, and all cells are therefore a mine.
-        """
-        mine_sentences = []
-        for sentence in self.knowledge:
-            if sentence.known_mines() != set():
-                mine_sentences.append(sentence)
-        return mine_sentences
+            # supersets are replaced by the difference sentence; inserting
+            # into the dict dedupes equal inferences for free.
+            removed = set()
+            inferred = {}
+            sentences = list(self.knowledge.items())
+            for cells_1, count_1 in sentences:
+                if cells_1 in removed:
+                    continue
+                for cells_2, count_2 in sentences:
+                    if cells_2 in removed or cells_1 == cells_2:
+                        continue
+                    if (cells_1 & cells_2) == cells_1:
+                        inferred[cells_2 & ~cells_1] = count_2 - count_1
+                        removed.add(cells_2)
+                        changed = True
+            for cells in removed:
+                del self.knowledge[cells]
+            self.knowledge.update(inferred)
+
+            # mark cells from any sentence that is now fully determined.
+            # marking rebuilds the dict, so restart the scan after each one.
+            determined = True
+            while determined:
+                determined = False
+                for cells, count in self.knowledge.items():
+                    if cells and (count == 0 or bin(cells).count("1") == count):
+                        mark = self.mark_safe if count == 0 else self.mark_mine
+                        for determined_cell in list(self.cells_in_mask(cells)):
+                            mark(determined_cell)
+                        changed = determined = True
+                        break
+
+            # remove the empty sentence left behind by fully marked masks
+            self.knowledge.pop(0, None)
 
     def make_safe_move(self):
         """
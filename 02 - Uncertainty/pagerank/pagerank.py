@@ -1,11 +1,20 @@
+import bisect
+import itertools
 import os
 import random
 import re
 import sys
 
+import numpy as np
+
 DAMPING = 0.85
 SAMPLES = 10000
 
+# compiled once at import; crawl matches it against every file in the corpus.
+# A bytes pattern lets files be read without decoding; only matched hrefs are
+# decoded.
+LINK_RE = re.compile(rb"<a\s+(?:[^>]*?)href=\"([^\"]*)\"")
+
 
 def main():
     if len(sys.argv) != 2:
@@ -33,9 +42,9 @@ def crawl(directory):
     for filename in os.listdir(directory):
         if not filename.endswith(".html"):
             continue
-        with open(os.path.join(directory, filename)) as f:
+        with open(os.path.join(directory, filename), "rb") as f:
             contents = f.read()
-            links = re.findall(r"<a\s+(?:[^>]*?)href=\"([^\"]*)\"", contents)
+            links = [link.decode() for link in LINK_RE.findall(contents)]
             pages[filename] = set(links) - {filename}
 
     # Only include links to other pages in the corpus
@@ -74,25 +83,38 @@ def sample_pagerank(corpus, damping_factor, n):
     PageRank values should sum to 1.
     """
 
-    # initialise page ranks dict. I.e. All keys start off on count of 0.
-    page_ranks = dict(zip(corpus.keys(),[0]*len(corpus)))
+    # fixed page order with counts and cumulative weights as flat lists
+    # indexed by page position, so the sampling loop touches no dicts.
+    pages = list(corpus.keys())
+    num_pages = len(pages)
+    page_index = {page: i for i, page in enumerate(pages)}
+    base = (1 - damping_factor) / num_pages
+
+    # build each page's cumulative transition distribution directly; the
+    # model depends only on the current page, so this happens once.
+    cumulative_weights = []
+    for page in pages:
+        if corpus[page]:
+            probs = [base] * num_pages
+            for link in corpus[page]:
+                probs[page_index[link]] += damping_factor / len(corpus[page])
+        else:
+            probs = [1 / num_pages] * num_pages
+        cumulative_weights.append(list(itertools.accumulate(probs)))
 
     # initialise iterative process by selecting a random page to begin on and addding 1 to count for that page.
-    # then complete remaining samples. 
-    current_page = random.choice(list(corpus.keys()))
-    page_ranks[current_page] += 1 
-    count = 1
-    while count != n:
-        distribution = transition_model(corpus,current_page,damping_factor)
-        current_page = random.choices(list(distribution.keys()),list(distribution.values()))[0]
-        page_ranks[current_page] += 1
-        count += 1
-    
-    # normalise page_rank values by dividing by n.
-    for key in page_ranks:
-        page_ranks[key] /= n    
+    # then complete remaining samples: each draw is one bisect with zero
+    # per-sample allocation (hi caps the index against float rounding).
+    page_counts = [0] * num_pages
+    current = random.randrange(num_pages)
+    page_counts[current] += 1
+    for _ in range(n - 1):
+        current = bisect.bisect(cumulative_weights[current], random.random(),
+                                0, num_pages - 1)
+        page_counts[current] += 1
 
-    return page_ranks
+    # normalise page_rank values by dividing by n.
+    return {page: page_counts[page_index[page]] / n for page in pages}
 
 
 def iterate_pagerank(corpus, damping_factor):
@@ -104,38 +126,35 @@ def iterate_pagerank(corpus, damping_factor):
     their estimated PageRank value (a value between 0 and 1). All
     PageRank values should sum to 1.
     """
-    page_ranks = dict(zip(corpus.keys(), [1/len(corpus)] * len(corpus)))
-    differences = dict(zip(corpus.keys(), [100] * len(corpus)))
-
-    # if a page (in coprus) contains no links then add a link to every page in corpus. 
+    pages = list(corpus)
+    num_pages = len(pages)
+    page_index = {page: i for i, page in enumerate(pages)}
+
+    # build the dense transition matrix once: entry [link, page] holds the
+    # probability of following a link from page to link. A page with no links
+    # is interpreted as linking to every page in the corpus.
+    transition_matrix = np.zeros((num_pages, num_pages))
     for page in corpus:
         if len(corpus[page]) == 0:
-            corpus[page] = corpus.keys()
+            transition_matrix[:, page_index[page]] = 1 / num_pages
+        else:
+            for link in corpus[page]:
+                transition_matrix[page_index[link], page_index[page]] = 1 / len(corpus[page])
 
-    # loop through updating page ranks according to formula until difference below 0.001 (error tolerance).
+    # loop updating all page ranks at once with a single matrix-vector
+    # product per iteration until every difference is below the tolerance.
     error_tol = 0.0001
+    page_ranks = np.full(num_pages, 1 / num_pages)
     keep_in_loop = True
     while keep_in_loop:
-        for page in page_ranks:
-            updated_page_rank = ((1-damping_factor)/len(corpus)) + (damping_factor * to_page_prob(page, corpus, page_ranks))
-            differences[page] = abs(page_ranks[page] - updated_page_rank)
-            page_ranks[page] = updated_page_rank
-
-        if all(difference < error_tol for difference in differences.values()):
+        updated_page_ranks = ((1 - damping_factor) / num_pages
+                              + damping_factor * (transition_matrix @ page_ranks))
+        if np.max(np.abs(updated_page_ranks - page_ranks)) < error_tol:
             keep_in_loop = False
-    
-    return page_ranks
+        page_ranks = updated_page_ranks
+
+    return dict(zip(pages, page_ranks.tolist()))
 
-def to_page_prob(page_p,corpus,page_ranks):
-    """ Returns probability of getting to page_p from 
-    all other links. I.e. the second part of the PageRank Fomula.
-    """
-    probability = 0
-    for page_i in page_ranks:
-        if page_p in corpus[page_i]:
-                    probability += page_ranks[page_i]/len(corpus[page_i])
-    return probability
-            
 
 
 
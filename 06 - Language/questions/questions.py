@@ -1,6 +1,8 @@
+import multiprocessing
 import nltk
 import sys
-from nltk.tokenize import word_tokenize
+from collections import Counter
+from nltk.tokenize import TreebankWordTokenizer
 import os
 import string
 import math
@@ -8,6 +10,18 @@ import math
 FILE_MATCHES = 1
 SENTENCE_MATCHES = 1
 
+# cached at module scope: stopwords.words() rebuilds a fresh list on every
+# call, and membership checks against a list are a linear scan per token.
+STOPWORDS = frozenset(nltk.corpus.stopwords.words("english"))
+
+# translation table deleting all punctuation characters in one pass.
+PUNCTUATION_TABLE = str.maketrans("", "", string.punctuation)
+
+# single tokenizer instances reused across calls: word_tokenize and
+# sent_tokenize are wrappers that fetch/construct their tokenizers per call.
+WORD_TOKENIZER = TreebankWordTokenizer()
+SENTENCE_TOKENIZER = nltk.data.load("tokenizers/punkt/english.pickle")
+
 
 
 def main():
@@ -16,12 +30,12 @@ def main():
     if len(sys.argv) != 2:
         sys.exit("Usage: python questions.py corpus")
 
-    # Calculate IDF values across files
+    # Calculate IDF values across files. Tokenization is CPU-bound pure
+    # Python with no shared state (the stopword set and punctuation table
+    # are module constants), so fan the corpus files out across cores.
     files = load_files(sys.argv[1])
-    file_words = {
-        filename: tokenize(files[filename])
-        for filename in files
-    }
+    with multiprocessing.Pool() as pool:
+        file_words = dict(zip(files.keys(), pool.map(tokenize, files.values())))
     file_idfs = compute_idfs(file_words)
     
 
@@ -35,7 +49,7 @@ def main():
     sentences = dict()
     for filename in filenames:
         for passage in files[filename].split("\n"):
-            for sentence in nltk.sent_tokenize(passage):
+            for sentence in SENTENCE_TOKENIZER.tokenize(passage):
                 tokens = tokenize(sentence)
                 if tokens:
                     sentences[sentence] = tokens
@@ -77,23 +91,20 @@ def tokenize(document):
     punctuation or English stopwords.
     """
     # tokenize document and remove stops words and punctuation.
-    document_tokens = word_tokenize(document.lower())
-    
+    document_tokens = WORD_TOKENIZER.tokenize(document.lower())
+
     formatted_tokens = list()
     for token in document_tokens:
         # check to see word isn't a stop word
-        if token not in nltk.corpus.stopwords.words("english"):
-            # removing any char in token that is punctuation
-            formatted_token = token
-            for char in token:
-                if char in string.punctuation:
-                    formatted_token = formatted_token.replace(char, "")
-            
+        if token not in STOPWORDS:
+            # strip any punctuation chars from token in a single C-level pass
+            formatted_token = token.translate(PUNCTUATION_TABLE)
+
             # if formatted_token is not empty string append to formatted_tokens
-            if formatted_token != ("" or "/n"): 
+            if formatted_token != "":
                 formatted_tokens.append(formatted_token)
 
-    
+
     return formatted_tokens
 
 
@@ -106,21 +117,16 @@ def compute_idfs(documents):
     resulting dictionary.
     """
     num_docs = len(documents)
-    idf_values_dict = dict()
-    seen_words = set()
-
-    # read in all words looping over each document
-    # and store count in a dict.
-    for document in documents:
-        for word in documents[document]:
-            # add unseen words to dict for counting and add 1 to count.
-            if word not in seen_words:
-                seen_words.add(word)
-                idf_values_dict[word] = 1
-            else:
-                idf_values_dict[word] += 1
+
+    # count document frequency: the number of documents each word appears in.
+    # set() collapses repeats within a document so a word counts once per doc.
+    document_frequencies = Counter()
+    for document_words in documents.values():
+        document_frequencies.update(set(document_words))
+
     # create dict that maps word to idf value for all seen words.
-    return {word: math.log(num_docs)/count for word, count in idf_values_dict.items()}
+    return {word: math.log(num_docs / frequency)
+            for word, frequency in document_frequencies.items()}
 
 
 def top_files(query, files, idfs, n):
@@ -131,13 +137,16 @@ def top_files(query, files, idfs, n):
     files that match the query, ranked according to tf-idf.
     """
     # calculate the sum of tf-idf values (corresponding to each word in query) for each document.
+    # term frequencies come from one Counter pass per file rather than a full
+    # file_words.count() scan per query word.
     document_scores = dict()
     for file_name, file_words in files.items():
+        word_counts = Counter(file_words)
         document_scores[file_name] = 0
         for word in query:
-            if word in file_words:
-                document_scores[file_name] +=  idfs[word] * file_words.count(word)
-    
+            if word in word_counts:
+                document_scores[file_name] += idfs[word] * word_counts[word]
+
     # rank the documents in descending order and return top n files from ranked list 
     ranked_files = list(dict(sorted(document_scores.items(), key=lambda item: item[1], reverse=True)).keys())
     return ranked_files[:n]
@@ -153,11 +162,12 @@ def top_sentences(query, sentences, idfs, n):
     """
     sentence_scores = dict()
     for sentence, sentences_words in sentences.items():
+        word_counts = Counter(sentences_words)
         sentence_scores[sentence] = [0,0]
         for word in query:
-            if word in sentences_words:
+            if word in word_counts:
                 sentence_scores[sentence][0] += idfs[word]
-                sentence_scores[sentence][1] += sentences_words.count(word) / len(sentences_words)
+                sentence_scores[sentence][1] += word_counts[word] / len(sentences_words)
 
     ranked_sentences = list(dict(sorted(sentence_scores.items(), key=lambda item: (item[1][0], item[1][1]), reverse=True)).keys())
     return ranked_sentences[:n]